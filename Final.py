@@ -39,7 +39,17 @@ from sympy.logic.boolalg import And, Or, Not, simplify_logic
 _last_expr = None           # raw user expression string
 _last_vars = []             # list of variable names (strings)
 _last_tt_rows = []          # list of (tuple_of_bits, output_int)
-_last_tt_window = None      # reference to truth table popup (optional)
+_last_tt_window = None      # reference to the single truth table window (reused)
+_tt_notebook = None         # tabbed pane inside the truth table window
+_tt_tabs = []               # list of (key, frame, tree), oldest first
+_tt_tab_count = 0           # running number used in tab titles
+_simplified_window = None   # reference to the single simplified results window (reused)
+_sop_text = None            # SOP text widget inside _simplified_window
+_pos_text = None            # POS text widget inside _simplified_window
+
+TT_HISTORY_DEPTH = 5        # default max truth tables kept open as tabs
+TT_HISTORY_MAX = 20         # upper limit offered by the "History" spinbox
+_tt_history_depth = TT_HISTORY_DEPTH  # current limit, changed from the window
 
 # ------------------------------------------------------------------
 # ------------- TRUTH TABLE GENERATION -----------------------------
@@ -68,7 +78,7 @@ def _evaluate_expr_truth_table(expr: str, variables: list[str]):
 
 
 def show_truth_table(expr: str):
-    global _last_expr, _last_vars, _last_tt_rows, _last_tt_window
+    global _last_expr, _last_vars, _last_tt_rows
 
     variables = _extract_variables(expr)
     if not variables:
@@ -86,15 +96,86 @@ def show_truth_table(expr: str):
     _last_vars = variables
     _last_tt_rows = rows
 
-    # build popup
+    _show_tt_tab(expr, variables, rows)
+
+
+def _close_tt_window():
+    """Destroy the truth table window and drop every table it held."""
+    global _last_tt_window, _tt_notebook, _tt_tabs, _tt_tab_count
+    if _last_tt_window is not None:
+        _last_tt_window.destroy()
+    _last_tt_window = None
+    _tt_notebook = None
+    _tt_tabs = []
+    _tt_tab_count = 0
+
+
+def _trim_tt_tabs():
+    """Destroy the oldest tabs until at most _tt_history_depth remain."""
+    while len(_tt_tabs) > _tt_history_depth:
+        _, frame, _ = _tt_tabs.pop(0)
+        _tt_notebook.forget(frame)
+        frame.destroy()
+
+
+def _set_tt_history_depth(spin: tk.Spinbox):
+    """Read the "History" spinbox and apply the new tab limit."""
+    global _tt_history_depth
+    try:
+        depth = int(spin.get())
+    except ValueError:
+        depth = _tt_history_depth
+    depth = max(1, min(TT_HISTORY_MAX, depth))
+
+    spin.delete(0, tk.END)
+    spin.insert(0, str(depth))
+    _tt_history_depth = depth
+    _trim_tt_tabs()
+
+
+def _get_tt_notebook():
+    """
+    Return the notebook of the truth table window, creating the window once.
+    Later calls reuse the same window instead of opening a new Toplevel.
+    """
+    global _last_tt_window, _tt_notebook, _tt_tabs
+
+    if _last_tt_window is not None and _last_tt_window.winfo_exists():
+        _last_tt_window.deiconify()
+        _last_tt_window.lift()
+        return _tt_notebook
+
     tt_win = tk.Toplevel(root)
     tt_win.title("Truth Table")
     tt_win.geometry("600x400")
     tt_win.resizable(True, True)
+    tt_win.protocol("WM_DELETE_WINDOW", _close_tt_window)
+
     _last_tt_window = tt_win
 
+    # history depth control
+    top_bar = tk.Frame(tt_win)
+    top_bar.pack(fill=tk.X, padx=5, pady=(5, 0))
+    tk.Label(top_bar, text="History (tabs):", font=("Arial", 10)).pack(side=tk.LEFT)
+    spin = tk.Spinbox(top_bar, from_=1, to=TT_HISTORY_MAX, width=4)
+    spin.delete(0, tk.END)
+    spin.insert(0, str(_tt_history_depth))
+    spin.config(command=lambda: _set_tt_history_depth(spin))
+    spin.bind("<Return>", lambda event: _set_tt_history_depth(spin))
+    spin.bind("<FocusOut>", lambda event: _set_tt_history_depth(spin))
+    spin.pack(side=tk.LEFT, padx=4)
+
+    _tt_notebook = ttk.Notebook(tt_win)
+    _tt_notebook.pack(fill=tk.BOTH, expand=True)
+    _tt_tabs = []
+    return _tt_notebook
+
+
+def _fill_tree(tree: ttk.Treeview, variables: list[str], rows):
+    """Swap the columns and rows of an existing Treeview in place."""
+    tree.delete(*tree.get_children())
     cols = variables + ["Output"]
-    tree = ttk.Treeview(tt_win, columns=cols, show="headings", height=20)
+    tree.configure(columns=cols)
     for c in cols:
         tree.heading(c, text=c)
         tree.column(c, anchor="center", width=60)
@@ -102,10 +183,48 @@ def show_truth_table(expr: str):
     for bits, out in rows:
         tree.insert("", tk.END, values=list(bits) + [out])
 
-    vsb = ttk.Scrollbar(tt_win, orient="vertical", command=tree.yview)
-    tree.configure(yscrollcommand=vsb.set)
-    tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-    vsb.pack(side=tk.RIGHT, fill=tk.Y)
+
+def _show_tt_tab(expr: str, variables: list[str], rows):
+    """
+    Show the truth table as a tab of the single results window.
+    An expression already on display is refreshed in its own tab; once
+    _tt_history_depth tabs are open the oldest tab is reused for the new table,
+    so the number of Treeviews (and their items) stays bounded.
+    """
+    global _tt_tab_count
+
+    notebook = _get_tt_notebook()
+
+    # same normalisation as gui_expr_to_sympy: "a + b" and "A+B" share a tab
+    key = expr.replace(" ", "").upper()
+    _tt_tab_count += 1
+    short = key if len(key) <= 20 else key[:17] + "..."
+    title = f"#{_tt_tab_count} {short}"
+
+    for i, (old_key, frame, tree) in enumerate(_tt_tabs):
+        if old_key == key:
+            _tt_tabs.pop(i)
+            break
+    else:
+        if len(_tt_tabs) >= _tt_history_depth:
+            _, frame, tree = _tt_tabs.pop(0)
+        else:
+            frame = tk.Frame(notebook)
+            tree = ttk.Treeview(frame, show="headings", height=20)
+            vsb = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+            tree.configure(yscrollcommand=vsb.set)
+            tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            vsb.pack(side=tk.RIGHT, fill=tk.Y)
+            notebook.add(frame, text=title)
+
+    _fill_tree(tree, variables, rows)
+    _tt_tabs.append((key, frame, tree))
+
+    # move the tab to the end (newest) and bring it to front;
+    # Notebook.insert on an already managed frame reorders it instead of
+    # adding a second tab, and updates its title
+    notebook.insert("end", frame, text=title)
+    notebook.select(frame)
 
 # ------------------------------------------------------------------
 # ------------- SIMPLIFICATION ONLY --------------------------------
@@ -257,23 +376,53 @@ def sympy_to_mathematical_notation(expr: sp.Expr) -> str:
     return expr_str
 
 
+def _close_simplified_window():
+    """Destroy the simplified results window and forget its widgets."""
+    global _simplified_window, _sop_text, _pos_text
+    if _simplified_window is not None:
+        _simplified_window.destroy()
+    _simplified_window = None
+    _sop_text = None
+    _pos_text = None
+
+
+def _set_text(widget: tk.Text, text: str):
+    """Replace the contents of a read-only Text widget."""
+    widget.config(state=tk.NORMAL)
+    widget.delete("1.0", tk.END)
+    widget.insert("1.0", text)
+    widget.config(state=tk.DISABLED)
+
+
 def show_simplified_window(sop_expr: sp.Expr, pos_expr: sp.Expr):
     """
     Popup window to show simplified SOP & POS expressions only.
+    The window is built once; later calls update its text in place.
     """
+    global _simplified_window, _sop_text, _pos_text
+
+    # Convert expressions to mathematical notation
+    sop_math = sympy_to_mathematical_notation(sop_expr)
+    pos_math = sympy_to_mathematical_notation(pos_expr)
+
+    if _simplified_window is not None and _simplified_window.winfo_exists():
+        _set_text(_sop_text, sop_math)
+        _set_text(_pos_text, pos_math)
+        _simplified_window.deiconify()
+        _simplified_window.lift()
+        return
+
     win = tk.Toplevel(root)
     win.title("Simplified Expressions")
     win.geometry("800x300")
     win.resizable(True, True)
+    win.protocol("WM_DELETE_WINDOW", _close_simplified_window)
+    _simplified_window = win
 
     # Create a frame for better organization
     main_frame = tk.Frame(win)
     main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
-    # Convert expressions to mathematical notation
-    sop_math = sympy_to_mathematical_notation(sop_expr)
-    pos_math = sympy_to_mathematical_notation(pos_expr)
-
     # SOP Section
     sop_frame = tk.Frame(main_frame)
     sop_frame.pack(fill=tk.X, pady=(0, 20))
@@ -284,8 +433,8 @@ def show_simplified_window(sop_expr: sp.Expr, pos_expr: sp.Expr):
     sop_text = tk.Text(sop_frame, height=3, font=("Consolas", 12), 
                        bg="#f0f8f0", fg="green", wrap=tk.WORD)
     sop_text.pack(fill=tk.X, pady=(5, 0))
-    sop_text.insert("1.0", sop_math)
-    sop_text.config(state=tk.DISABLED)
+    _set_text(sop_text, sop_math)
+    _sop_text = sop_text
 
     # POS Section
     pos_frame = tk.Frame(main_frame)
@@ -297,8 +446,8 @@ def show_simplified_window(sop_expr: sp.Expr, pos_expr: sp.Expr):
     pos_text = tk.Text(pos_frame, height=3, font=("Consolas", 12), 
                        bg="#f0f0f8", fg="blue", wrap=tk.WORD)
     pos_text.pack(fill=tk.X, pady=(5, 0))
-    pos_text.insert("1.0", pos_math)
-    pos_text.config(state=tk.DISABLED)
+    _set_text(pos_text, pos_math)
+    _pos_text = pos_text
 
     # Adding some helpful information
     info_frame = tk.Frame(main_frame)